@@ -181,7 +181,7 @@ async def get_cloud_urls_or_login() -> tuple[str, str, str]:
 
 def get_cloud_urls_without_login() -> tuple[str | None, str | None, str | None]:
     """Gets the cloud UI URL, API URL, and API key"""
-    api_url: str | None = get_api_url()
+    api_url, api_key = get_api_url_and_key()
     if not api_url:
         return None, None, None
 
@@ -192,7 +192,6 @@ def get_cloud_urls_without_login() -> tuple[str | None, str | None, str | None]:
         .replace("/workspaces/", "/workspace/")
     )
 
-    api_key = get_api_key()
     if not api_key:
         return None, None, None
 
@@ -360,22 +359,31 @@ async def prompt_for_account(accounts: Sequence[Account]) -> Account | None:
 
 def get_from_env_or_profile(key: str) -> str | None:
     """Gets value from the environment or the current cloud profile"""
-    profile = get_cloud_profile() or {}
-
     if from_env := os.environ.get(key):
         return from_env
-    elif from_profile := profile.get(key):
-        return from_profile
-    else:
-        return None
+
+    profile = get_cloud_profile() or {}
+    return profile.get(key) or None
 
 
 def get_api_key() -> str | None:
     return get_from_env_or_profile("PREFECT_API_KEY")
 
 
-def get_api_url() -> str | None:
-    return get_from_env_or_profile("PREFECT_API_URL")
+def get_api_url_and_key() -> tuple[str | None, str | None]:
+    """Gets the API URL and key from the environment or the current cloud profile
+
+    The profiles file is read at most once, and only when the environment is
+    missing one of them.
+    """
+    api_url = os.environ.get("PREFECT_API_URL")
+    api_key = os.environ.get("PREFECT_API_KEY")
+    if not (api_url and api_key):
+        profile = get_cloud_profile() or {}
+        api_url = api_url or profile.get("PREFECT_API_URL") or None
+        api_key = api_key or profile.get("PREFECT_API_KEY") or None
+
+    return api_url, api_key
 
 
 def load_profiles() -> dict[str, Any]:
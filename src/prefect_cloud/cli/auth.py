@@ -1,3 +1,5 @@
+import asyncio
+from collections import defaultdict
 from uuid import UUID
 from typing import Annotated
 
@@ -6,7 +8,7 @@ from rich.table import Table
 from rich.text import Text
 
 from prefect_cloud import auth
-from prefect_cloud.cli.deployments import app
+from prefect_cloud.cli.deployments import UUID_WIDTH, app
 from prefect_cloud.utilities.tui import redacted
 
 
@@ -95,9 +97,11 @@ async def whoami() -> None:
     """
     ui_url, api_url, api_key = await auth.get_cloud_urls_or_login()
 
-    me = await auth.me(api_key)
-    accounts = await auth.get_accounts(api_key)
-    workspaces = await auth.get_workspaces(api_key)
+    me, accounts, workspaces = await asyncio.gather(
+        auth.me(api_key),
+        auth.get_accounts(api_key),
+        auth.get_workspaces(api_key),
+    )
 
     table = Table(title="User", show_header=False)
     table.add_column("Property")
@@ -118,12 +122,10 @@ async def whoami() -> None:
     table = Table(title="Accounts and Workspaces", show_header=True)
     table.add_column("Account")
     table.add_column("Handle")
-    table.add_column("ID")
+    table.add_column("ID", width=UUID_WIDTH, no_wrap=True)
 
-    workspaces_by_account: dict[UUID, list[auth.Workspace]] = {}
+    workspaces_by_account: defaultdict[UUID, list[auth.Workspace]] = defaultdict(list)
     for workspace in workspaces:
-        if workspace.account_id not in workspaces_by_account:
-            workspaces_by_account[workspace.account_id] = []
         workspaces_by_account[workspace.account_id].append(workspace)
 
     for account in accounts:
@@ -10,8 +10,7 @@ CACHE_TTL = 86400
 
 
 def clear_cache():
-    if COMPLETION_CACHE.exists():
-        COMPLETION_CACHE.unlink()
+    COMPLETION_CACHE.unlink(missing_ok=True)
 
 
 def complete_deployment(incomplete: str) -> list[str]:
@@ -20,10 +19,12 @@ def complete_deployment(incomplete: str) -> list[str]:
         return []
 
     deployment_names = None
-    if (
-        COMPLETION_CACHE.exists()
-        and time.time() - COMPLETION_CACHE.stat().st_mtime < CACHE_TTL
-    ):
+    try:
+        is_fresh = time.time() - COMPLETION_CACHE.stat().st_mtime < CACHE_TTL
+    except FileNotFoundError:
+        is_fresh = False
+
+    if is_fresh:
         try:
             with open(COMPLETION_CACHE) as f:
                 cache = json.load(f)
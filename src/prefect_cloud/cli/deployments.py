@@ -1,8 +1,12 @@
-from typing import Annotated, Any
+import asyncio
+import contextlib
+from collections.abc import AsyncGenerator, Coroutine
+from typing import Annotated, Any, TypeVar
 from uuid import UUID
 
 import typer
 import tzlocal
+from rich.style import Style
 from rich.table import Table
 from rich.text import Text
 
@@ -10,6 +14,7 @@ from prefect_cloud import auth, deployments, following
 from prefect_cloud.cli import completions
 from prefect_cloud.cli.root import app
 from prefect_cloud.cli.utilities import process_key_value_pairs
+from prefect_cloud.client import PrefectCloudClient
 from prefect_cloud.dependencies import get_dependencies
 from prefect_cloud.github import (
     FileNotFound,
@@ -22,9 +27,60 @@ from prefect_cloud.schemas.objects import (
     DeploymentSchedule,
     IntervalSchedule,
     RRuleSchedule,
+    WorkPool,
 )
 from prefect_cloud.utilities.callables import get_parameter_schema_from_content
 
+ACTIVE_SCHEDULE_STYLE = Style(color="green")
+INACTIVE_SCHEDULE_STYLE = Style(dim=True)
+
+# IDs are always full UUIDs, so giving their columns a fixed width keeps them
+# from being truncated and spares Rich from measuring every cell
+UUID_WIDTH = 36
+
+T = TypeVar("T")
+
+
+@contextlib.asynccontextmanager
+async def _in_background(
+    coroutine: Coroutine[Any, Any, T],
+) -> AsyncGenerator[asyncio.Task[T], None]:
+    """
+    Run a coroutine as a task for the duration of the block, cancelling it and
+    waiting for it to finish if the block exits before awaiting it
+    """
+    task = asyncio.create_task(coroutine)
+    try:
+        yield task
+    finally:
+        task.cancel()
+        # If the block exited early, whatever the task raised is secondary to
+        # the reason the block exited, so it's retrieved here and dropped
+        with contextlib.suppress(asyncio.CancelledError, Exception):
+            await task
+
+
+async def _find_managed_work_pool(
+    client: PrefectCloudClient,
+) -> tuple[WorkPool | None, dict[str, Any] | None]:
+    """
+    Look up the managed work pool, also fetching the base job template to create
+    one with when the workspace doesn't have it yet
+    """
+    work_pool = await client.get_default_managed_work_pool()
+    if work_pool:
+        return work_pool, None
+    return None, await client.get_default_base_job_template_for_managed_work_pool()
+
+
+def _clone_directory_script_step(script: str) -> dict[str, Any]:
+    return {
+        "prefect.deployments.steps.run_shell_script": {
+            "directory": "{{ git-clone.directory }}",
+            "script": script,
+        }
+    }
+
 
 @app.command(rich_help_panel="Deploy")
 async def deploy(
@@ -162,13 +218,17 @@ async def deploy(
     ui_url, api_url, _ = await auth.get_cloud_urls_or_login()
 
     # Split function_path into file path and function name
-    try:
-        filepath, function = function.split(":")
-        filepath = filepath.lstrip("/")
-    except ValueError:
+    filepath, _, function = function.rpartition(":")
+    filepath = filepath.lstrip("/")
+    if not filepath or not function:
         app.exit_with_error("Invalid function. Expected path/to/file.py:function_name")
 
-    async with await auth.get_prefect_cloud_client() as client:
+    async with (
+        await auth.get_prefect_cloud_client() as client,
+        # Looking up the managed work pool and its template is read-only and
+        # doesn't depend on the repository, so do it while the repo is probed
+        _in_background(_find_managed_work_pool(client)) as work_pool_task,
+    ):
         with app.create_progress() as progress:
             task = progress.add_task("Connecting to repo...")
             env_vars = process_key_value_pairs(env)
@@ -218,6 +278,9 @@ async def deploy(
 
             # Process function parameters
             try:
+                # Kept on the event loop thread, since building the schema
+                # executes the module's imports and definitions, which isn't
+                # thread safe
                 parameter_schema = get_parameter_schema_from_content(
                     raw_contents, function
                 )
@@ -227,7 +290,7 @@ async def deploy(
                 )
 
             # Handle secrets
-            secret_env = {}
+            secret_env: dict[str, str] = {}
             for key, value in secrets.items():
                 if value.startswith("{") and value.endswith("}"):
                     secret_name = value[1:-1].strip()
@@ -240,7 +303,10 @@ async def deploy(
 
             # Provision infrastructure
             progress.update(task, description="Provisioning infrastructure...")
-            work_pool = await client.ensure_managed_work_pool()
+            # Only create a work pool once the function is known to be deployable
+            work_pool, template = await work_pool_task
+            if not work_pool:
+                work_pool = await client.create_managed_work_pool(template)
 
             progress.update(task, description="Deploying...")
 
@@ -250,23 +316,21 @@ async def deploy(
                     f"'{dependency}'" for dependency in get_dependencies(dependencies)
                 ]
                 pull_steps.append(
-                    {
-                        "prefect.deployments.steps.run_shell_script": {
-                            "directory": "{{ git-clone.directory }}",
-                            "script": f"uv pip install {' '.join(quoted_dependencies)}",
-                        }
-                    }
+                    _clone_directory_script_step(
+                        f"uv pip install {' '.join(quoted_dependencies)}"
+                    )
                 )
             if with_requirements:
                 pull_steps.append(
-                    {
-                        "prefect.deployments.steps.run_shell_script": {
-                            "directory": "{{ git-clone.directory }}",
-                            "script": f"uv pip install -r {with_requirements}",
-                        }
-                    }
+                    _clone_directory_script_step(
+                        f"uv pip install -r {with_requirements}"
+                    )
                 )
 
+            job_env: dict[str, Any] = {"PREFECT_CLOUD_API_URL": api_url}
+            job_env.update(env_vars)
+            job_env.update(secret_env)
+
             deployment_name = deployment_name or f"{function}"
             deployment_id = await client.create_managed_deployment(
                 deployment_name=deployment_name,
@@ -276,11 +340,12 @@ async def deploy(
                 pull_steps=pull_steps,
                 parameter_schema=parameter_schema,
                 job_variables={
-                    "env": {"PREFECT_CLOUD_API_URL": api_url} | env_vars | secret_env,
+                    "env": job_env,
                     "image": PythonVersion.to_prefect_image(with_python),
                 },
                 parameters=parameter_defaults,
             )
+            completions.clear_cache()
 
         deployment_url = f"{ui_url}/deployments/deployment/{deployment_id}"
         run_cmd = f"prefect-cloud run {function}/{deployment_name}"
@@ -367,7 +432,8 @@ async def run(
     ui_url, api_url, api_key = await auth.get_cloud_urls_or_login()
     func_kwargs = process_key_value_pairs(parameters, as_json=True)
 
-    flow_run = await deployments.run(deployment, func_kwargs)
+    run_context = await deployments.run(deployment, func_kwargs)
+    flow_run = run_context.flow_run
     flow_run_url = f"{ui_url}/runs/flow-run/{flow_run.id}"
 
     app.print(
@@ -376,12 +442,8 @@ async def run(
         soft_wrap=True,
     )
 
-    async with await auth.get_prefect_cloud_client() as client:
-        deployment_ = await deployments.get_deployment(deployment)
-        work_pool = await client.read_work_pool_by_name(deployment_.work_pool_name)
-
     work_pool_url = f"{ui_url}/work-pools"
-    if work_pool.is_paused:
+    if run_context.work_pool and run_context.work_pool.is_paused:
         app.print(
             "\n",
             "[bold][orange1]Note:[/orange1][/bold] Your work pool is",
@@ -448,9 +510,12 @@ async def schedule(
     """
     app.quiet = quiet
 
-    parameters = parameters or []
+    # Parameters only apply to a new schedule, so there's nothing to parse when
+    # the schedules are just being removed
+    func_kwargs: dict[str, Any] | None = None
+    if schedule and schedule.lower() != "none":
+        func_kwargs = process_key_value_pairs(parameters, as_json=True)
 
-    func_kwargs = process_key_value_pairs(parameters, as_json=True)
     await deployments.schedule(deployment, schedule, func_kwargs)
     app.exit_with_success("[bold]✓[/] Deployment scheduled")
 
@@ -492,11 +557,13 @@ async def ls():
     table.add_column("Name")
     table.add_column("Schedule")
     table.add_column("Next run")
-    table.add_column("ID")
+    table.add_column("ID", width=UUID_WIDTH, no_wrap=True)
 
     def describe_schedule(schedule: DeploymentSchedule) -> Text:
-        prefix = "✓" if schedule.active else " "
-        style = "dim" if not schedule.active else "green"
+        if schedule.active:
+            prefix, style = "✓", ACTIVE_SCHEDULE_STYLE
+        else:
+            prefix, style = " ", INACTIVE_SCHEDULE_STYLE
 
         if isinstance(schedule.schedule, CronSchedule):
             description = f"{schedule.schedule.cron} ({schedule.schedule.timezone})"
@@ -510,6 +577,8 @@ async def ls():
 
         return Text(f"{prefix} {description}", style=style)
 
+    local_tz = tzlocal.get_localzone()
+
     for deployment in context.deployments:
         scheduling = Text("\n").join(
             describe_schedule(schedule) for schedule in deployment.schedules
@@ -517,9 +586,9 @@ async def ls():
 
         next_run = context.next_runs_by_deployment_id.get(deployment.id)
         if next_run and next_run.expected_start_time:
-            next_run_time = next_run.expected_start_time.astimezone(
-                tzlocal.get_localzone()
-            ).strftime("%Y-%m-%d %H:%M:%S %Z")
+            next_run_time = next_run.expected_start_time.astimezone(local_tz).strftime(
+                "%Y-%m-%d %H:%M:%S %Z"
+            )
         else:
             next_run_time = ""
 
@@ -562,4 +631,5 @@ async def delete(
     app.quiet = quiet
 
     await deployments.delete(deployment)
+    completions.clear_cache()
     app.exit_with_success("[bold]✓[/] Deployment deleted")
@@ -18,6 +18,10 @@ from rich.theme import Theme
 
 T = TypeVar("T")
 
+# Characters that can begin a JSON document; values starting with anything else
+# are plain strings and don't need a trip through the JSON parser
+JSON_START_CHARACTERS = frozenset('{["-0123456789tfnNI')
+
 
 def process_key_value_pairs(
     pairs: list[str] | None,
@@ -42,12 +46,8 @@ def process_key_value_pairs(
     result = {}
 
     for pair in pairs:
-        parts = pair.split("=", 1)
-        if len(parts) != 2:
-            invalid_pairs.append(pair)
-            continue
-
-        key, value = parts
+        # A missing "=" leaves `value` empty, so one check covers both cases
+        key, _, value = pair.partition("=")
         if not key or not value:
             invalid_pairs.append(pair)
             continue
@@ -55,7 +55,7 @@ def process_key_value_pairs(
         key = key.strip()
         value = value.strip().strip("\"'")
 
-        if as_json:
+        if as_json and value[:1] in JSON_START_CHARACTERS:
             try:
                 result[key] = json.loads(value)
             except json.JSONDecodeError:
@@ -123,6 +123,10 @@ class PrefectCloudTyper(typer.Typer):
 
         @functools.wraps(fn)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
+            # Start each command loud so one invocation's `--quiet` never leaks
+            # into the next, and restore it afterwards for nested invocations
+            previous_quiet = self.quiet
+            self.quiet = False
             try:
                 return fn(*args, **kwargs)
             except (typer.Exit, typer.Abort, ClickException):
@@ -130,6 +134,8 @@ class PrefectCloudTyper(typer.Typer):
             except Exception as e:
                 traceback.print_exc()
                 self.exit_with_error(str(e) or "An error occurred.")
+            finally:
+                self.quiet = previous_quiet
 
         return wrapper
 
@@ -276,11 +282,11 @@ class PrefectCloudTyper(typer.Typer):
 def run_sync(coro: Coroutine[Any, Any, T]) -> T:
     """Run a coroutine synchronously.
 
-    This function uses asyncio to run a coroutine in a synchronous context.
-    It attempts the following strategies in order:
-    1. If no event loop is running, creates a new one and runs the coroutine
-    2. If a loop is running, attempts to run the coroutine on that loop
-    3. As a last resort, creates a new thread with its own event loop to run the coroutine
+    This function uses asyncio to run a coroutine in a synchronous context:
+    1. If no event loop is running, runs the coroutine on an event loop that is
+       created once and reused by later calls
+    2. If a loop is already running, it can't be blocked on, so creates a new
+       thread with its own event loop to run the coroutine
 
     Context variables are properly propagated between threads in all cases.
 
@@ -298,18 +304,30 @@ def run_sync(coro: Coroutine[Any, Any, T]) -> T:
     Returns:
         The result of the coroutine
     """
-    ctx = contextvars.copy_context()
     try:
-        loop = asyncio.get_event_loop()
+        asyncio.get_running_loop()
     except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-    try:
-        return ctx.run(loop.run_until_complete, coro)
-    except RuntimeError as e:
-        if "event loop" in str(e):
-            return run_sync_in_thread(coro)
-        raise e
+        pass
+    else:
+        return run_sync_in_thread(coro)
+
+    ctx = contextvars.copy_context()
+    return ctx.run(_get_sync_loop().run_until_complete, coro)
+
+
+_sync_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _get_sync_loop() -> asyncio.AbstractEventLoop:
+    """Get the event loop `run_sync` reuses, creating it on first use.
+
+    This avoids `asyncio.get_event_loop()`, which is deprecated when no loop is
+    running.
+    """
+    global _sync_loop
+    if _sync_loop is None or _sync_loop.is_closed():
+        _sync_loop = asyncio.new_event_loop()
+    return _sync_loop
 
 
 def run_sync_in_thread(coro: Coroutine[Any, Any, T]) -> T:
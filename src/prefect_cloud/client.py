@@ -3,7 +3,7 @@ from __future__ import annotations
 import asyncio
 import random
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Any, Dict, Literal, Optional, Union
+from typing import Any, Dict, Literal, Optional, Union
 from uuid import UUID
 
 import httpx
@@ -12,12 +12,15 @@ from typing_extensions import TypeAlias
 
 from prefect_cloud.schemas.actions import (
     BlockDocumentCreate,
+    DeploymentCreate,
+    DeploymentScheduleCreate,
 )
 from prefect_cloud.schemas.objects import (
     BlockDocument,
     BlockSchema,
     BlockType,
     CronSchedule,
+    Deployment,
     DeploymentFlowRun,
     DeploymentSchedule,
     Flow,
@@ -34,9 +37,6 @@ from prefect_cloud.utilities.exception import (
 )
 from prefect_cloud.utilities.generics import validate_list
 
-if TYPE_CHECKING:
-    from prefect_cloud.schemas.objects import Deployment
-
 PREFECT_MANAGED = "prefect:managed"
 HTTP_METHODS: TypeAlias = Literal["GET", "POST", "PUT", "DELETE", "PATCH"]
 
@@ -104,6 +104,7 @@ class PrefectCloudClient(httpx.AsyncClient):
         httpx_settings.setdefault("headers", {"Authorization": f"Bearer {api_key}"})
         httpx_settings.setdefault("base_url", api_url)
         super().__init__(**httpx_settings)
+        self._secret_block_ids: tuple[UUID, UUID] | None = None
 
     async def request(
         self,
@@ -223,8 +224,6 @@ class PrefectCloudClient(httpx.AsyncClient):
         Returns:
             A list of work pools.
         """
-        from prefect_cloud.schemas.objects import WorkPool
-
         body: dict[str, Any] = {
             "limit": None,
             "offset": 0,
@@ -235,7 +234,7 @@ class PrefectCloudClient(httpx.AsyncClient):
 
     async def read_work_pool_by_name(self, name: str) -> "WorkPool":
         response = await self.request("GET", f"/work_pools/{name}")
-        return WorkPool.model_validate(response.json())
+        return WorkPool.model_validate_json(response.content)
 
     async def create_work_pool_managed_by_name(
         self,
@@ -251,8 +250,6 @@ class PrefectCloudClient(httpx.AsyncClient):
         Returns:
             Information about the newly created work pool.
         """
-        from prefect_cloud.schemas.objects import WorkPool
-
         try:
             response = await self.request(
                 "POST",
@@ -270,7 +267,7 @@ class PrefectCloudClient(httpx.AsyncClient):
             else:
                 raise
 
-        return WorkPool.model_validate(response.json())
+        return WorkPool.model_validate_json(response.content)
 
     async def create_flow_from_name(self, flow_name: str) -> "UUID":
         """
@@ -294,8 +291,6 @@ class PrefectCloudClient(httpx.AsyncClient):
             raise RequestError(f"Malformed response: {response}")
 
         # Return the id of the created flow
-        from uuid import UUID
-
         return UUID(flow_id)
 
     async def create_deployment(
@@ -325,8 +320,6 @@ class PrefectCloudClient(httpx.AsyncClient):
         Returns:
             the ID of the deployment in the backend
         """
-        from prefect_cloud.schemas.actions import DeploymentCreate
-
         if parameter_openapi_schema is None:
             parameter_openapi_schema = {}
 
@@ -387,9 +380,8 @@ class PrefectCloudClient(httpx.AsyncClient):
             response.raise_for_status()
         except HTTPStatusError:
             raise
-        from prefect_cloud.schemas.objects import BlockDocument
 
-        return BlockDocument.model_validate(response.json())
+        return BlockDocument.model_validate_json(response.content)
 
     async def read_block_type_by_slug(self, slug: str) -> "BlockType":
         """
@@ -406,9 +398,8 @@ class PrefectCloudClient(httpx.AsyncClient):
                 raise ObjectNotFound(http_exc=e) from e
             else:
                 raise
-        from prefect_cloud.schemas.objects import BlockType
 
-        return BlockType.model_validate(response.json())
+        return BlockType.model_validate_json(response.content)
 
     async def get_most_recent_block_schema_for_block_type(
         self,
@@ -439,7 +430,8 @@ class PrefectCloudClient(httpx.AsyncClient):
         except HTTPStatusError:
             raise
 
-        return next(iter(validate_list(BlockSchema, response.json())), None)
+        block_schemas = response.json()
+        return BlockSchema.model_validate(block_schemas[0]) if block_schemas else None
 
     async def read_deployment(
         self,
@@ -454,10 +446,6 @@ class PrefectCloudClient(httpx.AsyncClient):
         Returns:
             a [Deployment model][prefect.client.schemas.objects.Deployment] representation of the deployment
         """
-        from uuid import UUID
-
-        from prefect_cloud.schemas.responses import DeploymentResponse
-
         if not isinstance(deployment_id, UUID):
             try:
                 deployment_id = UUID(deployment_id)
@@ -476,7 +464,7 @@ class PrefectCloudClient(httpx.AsyncClient):
             else:
                 raise
 
-        return DeploymentResponse.model_validate(response.json())
+        return DeploymentResponse.model_validate_json(response.content)
 
     async def read_deployment_by_name(
         self,
@@ -495,8 +483,6 @@ class PrefectCloudClient(httpx.AsyncClient):
         Returns:
             a Deployment model representation of the deployment
         """
-        from prefect_cloud.schemas.responses import DeploymentResponse
-
         try:
             flow_name, deployment_name = name.split("/")
             response = await self.request(
@@ -514,7 +500,7 @@ class PrefectCloudClient(httpx.AsyncClient):
             else:
                 raise
 
-        return DeploymentResponse.model_validate(response.json())
+        return DeploymentResponse.model_validate_json(response.content)
 
     async def read_all_flows(
         self,
@@ -541,7 +527,6 @@ class PrefectCloudClient(httpx.AsyncClient):
         }
 
         response = await self.request("POST", "/flows/filter", json=body)
-        from prefect_cloud.schemas.objects import Flow
 
         return validate_list(Flow, response.json())
 
@@ -563,8 +548,6 @@ class PrefectCloudClient(httpx.AsyncClient):
             a list of Deployment model representations
                 of the deployments
         """
-        from prefect_cloud.schemas.objects import Deployment
-
         body: dict[str, Any] = {
             "limit": limit,
             "offset": offset,
@@ -595,9 +578,6 @@ class PrefectCloudClient(httpx.AsyncClient):
         Returns:
             the list of schedules created in the backend
         """
-        from prefect_cloud.schemas.actions import DeploymentScheduleCreate
-        from prefect_cloud.schemas.objects import DeploymentSchedule
-
         json = DeploymentScheduleCreate(
             schedule=schedule,
             active=active,
@@ -624,8 +604,6 @@ class PrefectCloudClient(httpx.AsyncClient):
         Returns:
             a list of DeploymentSchedule model representations of the deployment schedules
         """
-        from prefect_cloud.schemas.objects import DeploymentSchedule
-
         try:
             response = await self.request(
                 "GET",
@@ -710,14 +688,12 @@ class PrefectCloudClient(httpx.AsyncClient):
         Returns:
             The flow run model
         """
-        from prefect_cloud.schemas.objects import DeploymentFlowRun
-
         response = await self.request(
             "POST",
             f"/deployments/{deployment_id}/create_flow_run",
             json={"parameters": parameters or {}},
         )
-        return DeploymentFlowRun.model_validate(response.json())
+        return DeploymentFlowRun.model_validate_json(response.content)
 
     async def read_next_scheduled_flow_runs_by_deployment_ids(
         self,
@@ -752,8 +728,6 @@ class PrefectCloudClient(httpx.AsyncClient):
 
         response = await self.request("POST", "/flow_runs/filter", json=body)
 
-        from prefect_cloud.schemas.objects import DeploymentFlowRun
-
         return validate_list(DeploymentFlowRun, response.json())
 
     async def get_default_managed_work_pool(self) -> WorkPool | None:
@@ -769,6 +743,13 @@ class PrefectCloudClient(httpx.AsyncClient):
             return work_pool
 
         template = await self.get_default_base_job_template_for_managed_work_pool()
+        return await self.create_managed_work_pool(template, name=name)
+
+    async def create_managed_work_pool(
+        self,
+        template: dict[str, Any] | None,
+        name: str = settings.default_managed_work_pool_name,
+    ) -> WorkPool:
         if template is None:
             raise ValueError("No default base job template found for managed work pool")
 
@@ -808,21 +789,14 @@ class PrefectCloudClient(httpx.AsyncClient):
     async def create_or_replace_secret(self, name: str, secret: str) -> str:
         try:
             safe_name = safe_block_name(name)
-            secret_block_type = await self.read_block_type_by_slug("secret")
-            secret_block_schema = (
-                await self.get_most_recent_block_schema_for_block_type(
-                    block_type_id=secret_block_type.id
-                )
-            )
-            if secret_block_schema is None:
-                raise ValueError("No secret block schema found")
+            block_type_id, block_schema_id = await self._read_secret_block_ids()
 
             block = await self.upsert_block_document(
                 BlockDocumentCreate(
                     name=safe_name,
                     data={"value": secret},
-                    block_type_id=secret_block_type.id,
-                    block_schema_id=secret_block_schema.id,
+                    block_type_id=block_type_id,
+                    block_schema_id=block_schema_id,
                 )
             )
             assert block.name
@@ -830,6 +804,27 @@ class PrefectCloudClient(httpx.AsyncClient):
         except HTTPStatusError:
             raise
 
+    async def _read_secret_block_ids(self) -> tuple[UUID, UUID]:
+        """
+        Read the IDs of the secret block type and its most recent schema.
+
+        These don't change while a command runs, so they are read once per
+        client and reused for every secret it creates.
+        """
+        if self._secret_block_ids is None:
+            secret_block_type = await self.read_block_type_by_slug("secret")
+            secret_block_schema = (
+                await self.get_most_recent_block_schema_for_block_type(
+                    block_type_id=secret_block_type.id
+                )
+            )
+            if secret_block_schema is None:
+                raise ValueError("No secret block schema found")
+
+            self._secret_block_ids = (secret_block_type.id, secret_block_schema.id)
+
+        return self._secret_block_ids
+
     async def get_default_base_job_template_for_managed_work_pool(
         self,
     ) -> Optional[Dict[str, Any]]:
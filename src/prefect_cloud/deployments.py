@@ -1,3 +1,4 @@
+import asyncio
 import zoneinfo
 from dataclasses import dataclass
 from typing import Any, Optional
@@ -6,11 +7,13 @@ from uuid import UUID
 import tzlocal
 
 from prefect_cloud.auth import get_prefect_cloud_client
+from prefect_cloud.client import PrefectCloudClient
 from prefect_cloud.schemas.objects import (
     CronSchedule,
     Deployment,
     DeploymentFlowRun,
     Flow,
+    WorkPool,
 )
 from prefect_cloud.schemas.responses import DeploymentResponse
 
@@ -22,14 +25,25 @@ class DeploymentListContext:
     next_runs_by_deployment_id: dict[UUID, DeploymentFlowRun]
 
 
+@dataclass
+class DeploymentRunContext:
+    flow_run: DeploymentFlowRun
+    # None when the work pool couldn't be read; only used to warn about pausing
+    work_pool: WorkPool | None
+
+
 async def list() -> DeploymentListContext:
     async with await get_prefect_cloud_client() as client:
-        deployments = await client.read_all_deployments()
-        flows_by_id = {flow.id: flow for flow in await client.read_all_flows()}
+        # Flows don't depend on the deployments, so read them alongside
+        deployments, flows = await asyncio.gather(
+            client.read_all_deployments(), client.read_all_flows()
+        )
+        flows_by_id = {flow.id: flow for flow in flows}
 
         next_runs = await client.read_next_scheduled_flow_runs_by_deployment_ids(
             deployment_ids=[deployment.id for deployment in deployments],
         )
+
         next_runs_by_deployment_id: dict[UUID, DeploymentFlowRun] = {}
         for run in next_runs:
             if (_id := run.deployment_id) and _id not in next_runs_by_deployment_id:
@@ -42,43 +56,72 @@ async def list() -> DeploymentListContext:
     )
 
 
+async def _read_deployment(
+    client: PrefectCloudClient, deployment_: str
+) -> DeploymentResponse:
+    try:
+        deployment_id = UUID(deployment_)
+    except ValueError:
+        return await client.read_deployment_by_name(deployment_)
+    else:
+        return await client.read_deployment(deployment_id)
+
+
 async def get_deployment(deployment_: str) -> DeploymentResponse:
     async with await get_prefect_cloud_client() as client:
-        try:
-            deployment_id = UUID(deployment_)
-        except ValueError:
-            return await client.read_deployment_by_name(deployment_)
-        else:
-            return await client.read_deployment(deployment_id)
+        return await _read_deployment(client, deployment_)
 
 
 async def delete(deployment_: str):
-    deployment = await get_deployment(deployment_)
-
     async with await get_prefect_cloud_client() as client:
+        deployment = await _read_deployment(client, deployment_)
         await client.delete_deployment(deployment.id)
 
 
 async def run(
     deployment_: str,
     parameters: dict[str, Any] | None = None,
-) -> DeploymentFlowRun:
-    deployment = await get_deployment(deployment_)
-
+) -> DeploymentRunContext:
     async with await get_prefect_cloud_client() as client:
-        return await client.create_flow_run_from_deployment_id(
-            deployment.id, parameters
+        deployment = await _read_deployment(client, deployment_)
+        # Let both requests finish so a failed work pool read can't close the
+        # client while the flow run is still being created
+        flow_run, work_pool = await asyncio.gather(
+            client.create_flow_run_from_deployment_id(deployment.id, parameters),
+            client.read_work_pool_by_name(deployment.work_pool_name),
+            return_exceptions=True,
         )
 
+    if isinstance(flow_run, BaseException):
+        raise flow_run
+
+    # The work pool is only needed to warn that it's paused, so the run still
+    # counts as started if it couldn't be read
+    if isinstance(work_pool, BaseException):
+        work_pool = None
+
+    return DeploymentRunContext(flow_run=flow_run, work_pool=work_pool)
+
 
 async def schedule(
     deployment_: str, schedule: str | None, parameters: Optional[dict[str, Any]] = None
 ):
-    deployment = await get_deployment(deployment_)
-
     async with await get_prefect_cloud_client() as client:
-        for prior_schedule in deployment.schedules:
-            await client.delete_deployment_schedule(deployment.id, prior_schedule.id)
+        deployment = await _read_deployment(client, deployment_)
+
+        # Let every delete finish before raising, so a failure can't close the
+        # client under the others, and the new schedule is only created once
+        # all of the prior ones are gone
+        results = await asyncio.gather(
+            *(
+                client.delete_deployment_schedule(deployment.id, prior_schedule.id)
+                for prior_schedule in deployment.schedules
+            ),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
 
         if schedule and schedule.lower() != "none":
             localzone = tzlocal.get_localzone()
@@ -1,5 +1,4 @@
 from typing import Annotated, TypeVar
-from zoneinfo import available_timezones
 
 from pydantic import (
     BeforeValidator,
@@ -16,17 +15,6 @@ NonNegativeInteger = Annotated[int, Field(ge=0)]
 PositiveInteger = Annotated[int, Field(gt=0)]
 NonNegativeFloat = Annotated[float, Field(ge=0.0)]
 
-TimeZone = Annotated[
-    str,
-    Field(
-        default="UTC",
-        pattern="|".join(
-            [z for z in sorted(available_timezones()) if "localtime" not in z]
-        ),
-    ),
-]
-
-
 BANNED_CHARACTERS = ["/", "%", "&", ">", "<"]
 
 WITHOUT_BANNED_CHARACTERS = r"^[^" + "".join(BANNED_CHARACTERS) + "]+$"
@@ -227,8 +227,9 @@ def parameter_schema_from_entrypoint(entrypoint: str) -> ParameterSchema:
         if not spec or not spec.origin:
             raise ValueError(f"Could not find module {path!r}")
         source_code = Path(spec.origin).read_text()
-    signature = _generate_signature_from_source(source_code, func_name, filepath)
-    docstring = _get_docstring_from_source(source_code, func_name)
+    parsed_code = ast.parse(source_code)
+    signature = _generate_signature_from_source(parsed_code, func_name, filepath)
+    docstring = _get_docstring_from_source(parsed_code, func_name)
     return generate_parameter_schema(signature, parameter_docstrings(docstring))
 
 
@@ -276,7 +277,7 @@ def generate_parameter_schema(
 
 
 def _generate_signature_from_source(
-    source_code: str, func_name: str, filepath: Optional[str] = None
+    source_code: str | ast.Module, func_name: str, filepath: Optional[str] = None
 ) -> inspect.Signature:
     """
     Extract the signature of a function from its source code.
@@ -284,17 +285,17 @@ def _generate_signature_from_source(
     Will ignore missing imports and exceptions while loading local class definitions.
 
     Args:
-        source_code: The source code where the function named `func_name` is declared.
+        source_code: The source code where the function named `func_name` is declared,
+            either as a string or already parsed into an AST.
         func_name: The name of the function.
 
     Returns:
         The signature of the function.
     """
+    parsed_code = _parse_source(source_code)
     # Load the namespace from the source code. Missing imports and exceptions while
     # loading local class definitions are ignored.
-    namespace = safe_load_namespace(source_code, filepath=filepath)
-    # Parse the source code into an AST
-    parsed_code = ast.parse(source_code)
+    namespace = safe_load_namespace(parsed_code, filepath=filepath)
 
     func_def = next(
         (
@@ -441,18 +442,20 @@ def _generate_signature_from_source(
     return inspect.Signature(parameters, return_annotation=return_annotation)
 
 
-def _get_docstring_from_source(source_code: str, func_name: str) -> Optional[str]:
+def _get_docstring_from_source(
+    source_code: str | ast.Module, func_name: str
+) -> Optional[str]:
     """
     Extract the docstring of a function from its source code.
 
     Args:
-        source_code (str): The source code of the function.
+        source_code (str | ast.Module): The source code of the function, or its AST.
         func_name (str): The name of the function.
 
     Returns:
         The docstring of the function. If the function has no docstring, returns None.
     """
-    parsed_code = ast.parse(source_code)
+    parsed_code = _parse_source(source_code)
 
     func_def = next(
         (
@@ -483,7 +486,7 @@ def _get_docstring_from_source(source_code: str, func_name: str) -> Optional[str
 
 
 def safe_load_namespace(
-    source_code: str, filepath: Optional[str] = None
+    source_code: str | ast.Module, filepath: Optional[str] = None
 ) -> dict[str, Any]:
     """
     Safely load a namespace from source code, optionally handling relative imports.
@@ -493,19 +496,18 @@ def safe_load_namespace(
     and use of it in threaded contexts may result in undesirable behavior.
 
     Args:
-        source_code: The source code to load
+        source_code: The source code to load, or its AST. The AST is not modified.
         filepath: Optional file path of the source code. If provided, enables relative imports.
 
     Returns:
         The namespace loaded from the source code.
     """
-    parsed_code = ast.parse(source_code)
+    parsed_code = _parse_source(source_code)
 
     namespace: dict[str, Any] = {"__name__": "prefect_safe_namespace_loader"}
 
-    # Remove the body of the if __name__ == "__main__": block
-    new_body = [node for node in parsed_code.body if not _is_main_block(node)]
-    parsed_code.body = new_body
+    # Skip the body of the if __name__ == "__main__": block
+    body = [node for node in parsed_code.body if not _is_main_block(node)]
 
     temp_module = None
     original_sys_path = None
@@ -532,7 +534,7 @@ def safe_load_namespace(
         temp_module.__spec__.submodule_search_locations = [file_dir]
 
     try:
-        for node in parsed_code.body:
+        for node in body:
             if isinstance(node, ast.Import):
                 for alias in node.names:
                     module_name = alias.name
@@ -622,7 +624,7 @@ def safe_load_namespace(
                     except ImportError as e:
                         logger.debug("Failed to import from %s: %s", module_name, e)
         # Handle local definitions
-        for node in parsed_code.body:
+        for node in body:
             if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.Assign)):
                 try:
                     code = compile(
@@ -642,6 +644,15 @@ def safe_load_namespace(
     return namespace
 
 
+def _parse_source(source_code: str | ast.Module) -> ast.Module:
+    """
+    Parse source code into an AST, passing through source that is already parsed.
+    """
+    if isinstance(source_code, ast.Module):
+        return source_code
+    return ast.parse(source_code)
+
+
 def _is_main_block(node: ast.AST):
     """
     Check if the node is an `if __name__ == "__main__":` block.
@@ -663,8 +674,9 @@ def _is_main_block(node: ast.AST):
 
 
 def get_parameter_schema_from_content(
-    content: str, function_name: str
+    content: str | ast.Module, function_name: str
 ) -> ParameterSchema:
-    signature = _generate_signature_from_source(content, function_name)
-    docstring = _get_docstring_from_source(content, function_name)
+    parsed_code = _parse_source(content)
+    signature = _generate_signature_from_source(parsed_code, function_name)
+    docstring = _get_docstring_from_source(parsed_code, function_name)
     return generate_parameter_schema(signature, parameter_docstrings(docstring))
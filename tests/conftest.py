@@ -14,6 +14,14 @@ def mock_profiles_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
     return profiles_path
 
 
+@pytest.fixture(autouse=True)
+def mock_completion_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Provides a temporary path for the shell completion cache."""
+    cache_path = tmp_path / "prefect-cloud-completions.json"
+    monkeypatch.setattr("prefect_cloud.cli.completions.COMPLETION_CACHE", cache_path)
+    return cache_path
+
+
 @pytest.fixture(autouse=True)
 def cloud_api(mock_profiles_path: Path):
     """
@@ -12,6 +12,7 @@ from prefect_cloud.auth import (
     get_api_key,
     get_api_key_or_login,
     get_cloud_profile,
+    get_cloud_urls_without_login,
     load_profiles,
     logout,
     remove_cloud_profile,
@@ -84,6 +85,38 @@ def test_get_api_key_returns_key_from_profile(
     assert get_api_key() == sample_api_key
 
 
+def test_get_cloud_urls_without_login_reads_profile_once(
+    mock_profiles_path: Path, sample_api_key: str, sample_workspace: Workspace
+):
+    """get_cloud_urls_without_login() should read the profiles file only once."""
+    set_cloud_profile(sample_api_key, sample_workspace)
+
+    with patch(
+        "prefect_cloud.auth.get_cloud_profile", wraps=get_cloud_profile
+    ) as mock_get_cloud_profile:
+        _, api_url, api_key = get_cloud_urls_without_login()
+
+    assert api_url == sample_workspace.api_url
+    assert api_key == sample_api_key
+    mock_get_cloud_profile.assert_called_once()
+
+
+def test_get_cloud_urls_without_login_skips_profile_with_env_vars(
+    monkeypatch: pytest.MonkeyPatch, mock_profiles_path: Path
+):
+    """get_cloud_urls_without_login() should not read the profiles file when the
+    environment has both values."""
+    monkeypatch.setenv("PREFECT_API_URL", "https://api.prefect.cloud/api/x")
+    monkeypatch.setenv("PREFECT_API_KEY", "pnu_from_env")
+
+    with patch("prefect_cloud.auth.get_cloud_profile") as mock_get_cloud_profile:
+        _, api_url, api_key = get_cloud_urls_without_login()
+
+    assert api_url == "https://api.prefect.cloud/api/x"
+    assert api_key == "pnu_from_env"
+    mock_get_cloud_profile.assert_not_called()
+
+
 def test_get_cloud_profile_no_profiles_file(mock_profiles_path: Path):
     """get_cloud_profile() should return None when profiles file doesn't exist."""
     assert mock_profiles_path.exists()
@@ -0,0 +1,66 @@
+import json
+import os
+import time
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+import respx
+from httpx import Response
+
+from prefect_cloud.cli import completions
+
+API_URL = "https://api.prefect.cloud/api/accounts/123/workspaces/456"
+
+
+@pytest.fixture(autouse=True)
+def logged_in(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("PREFECT_API_URL", API_URL)
+    monkeypatch.setenv("PREFECT_API_KEY", "test_key")
+
+
+@pytest.fixture
+def cache_path(mock_completion_cache: Path) -> Path:
+    return mock_completion_cache
+
+
+def test_complete_deployment_uses_fresh_cache(
+    cache_path: Path, cloud_api: respx.Router
+):
+    """`complete_deployment` should answer from a fresh cache without any requests"""
+    cache_path.write_text(
+        json.dumps({"deployment_names": ["flow/one", "flow/two", "other/three"]})
+    )
+
+    assert completions.complete_deployment("flow/") == ["flow/one", "flow/two"]
+    assert not cloud_api.calls
+
+
+def test_complete_deployment_refreshes_stale_cache(
+    cache_path: Path, cloud_api: respx.Router
+):
+    """`complete_deployment` should refetch and rewrite a stale cache"""
+    cache_path.write_text(json.dumps({"deployment_names": ["stale/name"]}))
+    stale = time.time() - completions.CACHE_TTL - 1
+    os.utime(cache_path, (stale, stale))
+
+    flow_id = str(uuid4())
+    cloud_api.post(f"{API_URL}/deployments/filter").mock(
+        return_value=Response(200, json=[{"flow_id": flow_id, "name": "fresh"}])
+    )
+    cloud_api.post(f"{API_URL}/flows/filter").mock(
+        return_value=Response(200, json=[{"id": flow_id, "name": "flow"}])
+    )
+
+    assert completions.complete_deployment("") == ["flow/fresh"]
+    assert json.loads(cache_path.read_text()) == {"deployment_names": ["flow/fresh"]}
+
+
+def test_clear_cache_removes_cache(cache_path: Path):
+    """`clear_cache` should remove the cache file, and tolerate it being absent"""
+    cache_path.write_text(json.dumps({"deployment_names": []}))
+
+    completions.clear_cache()
+    completions.clear_cache()
+
+    assert not cache_path.exists()
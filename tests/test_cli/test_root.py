@@ -3,6 +3,8 @@ from __future__ import annotations
 import contextlib
 import re
 import textwrap
+from datetime import timedelta
+from pathlib import Path
 from typing import Iterable
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
@@ -13,9 +15,16 @@ from rich.console import Console
 from typer.testing import CliRunner
 
 from prefect_cloud.cli.deployments import app
+from prefect_cloud.deployments import DeploymentListContext, DeploymentRunContext
 from prefect_cloud.github import FileNotFound
-from prefect_cloud.schemas.objects import WorkPool
-from prefect_cloud.schemas.responses import DeploymentResponse
+from prefect_cloud.schemas.objects import (
+    CronSchedule,
+    Deployment,
+    DeploymentSchedule,
+    Flow,
+    IntervalSchedule,
+    WorkPool,
+)
 from prefect_cloud.utilities.blocks import safe_block_name
 
 
@@ -203,7 +212,7 @@ def test_deploy_command_basic():
         mock_client.return_value.__aenter__.return_value = client
 
         # Mock auth responses
-        client.ensure_managed_work_pool = AsyncMock(
+        client.get_default_managed_work_pool = AsyncMock(
             return_value=WorkPool(
                 type="prefect:managed", name="test-pool", is_paused=False
             )
@@ -252,6 +261,97 @@ def test_deploy_command_basic():
                 assert call_kwargs["work_pool_name"] == "test-pool"
 
 
+def test_deploy_clears_completion_cache(mock_completion_cache: Path):
+    """Test deployment clears the cached deployment names used for completions"""
+    mock_completion_cache.write_text('{"deployment_names": []}')
+
+    with patch("prefect_cloud.auth.get_prefect_cloud_client") as mock_client:
+        client = AsyncMock()
+        mock_client.return_value.__aenter__.return_value = client
+
+        client.get_default_managed_work_pool = AsyncMock(
+            return_value=WorkPool(
+                type="prefect:managed", name="test-pool", is_paused=False
+            )
+        )
+        client.create_managed_deployment = AsyncMock(return_value="test-deployment-id")
+
+        with patch(
+            "prefect_cloud.cli.deployments.auth.get_cloud_urls_or_login"
+        ) as mock_urls:
+            mock_urls.return_value = ("https://ui.url", "https://api.url", "test-key")
+
+            with patch(
+                "prefect_cloud.github.GitHubRepo.get_file_contents"
+            ) as mock_content:
+                mock_content.return_value = textwrap.dedent("""
+                    def test_function():
+                        pass
+                """).lstrip()
+
+                invoke_and_assert(
+                    command=[
+                        "deploy",
+                        "test.py:test_function",
+                        "--from",
+                        "github.com/owner/repo",
+                    ],
+                    expected_code=0,
+                    expected_output_contains="Deployed test_function",
+                )
+
+    assert not mock_completion_cache.exists()
+
+
+def test_deploy_creates_work_pool_when_none_exists():
+    """Test deployment creates the managed work pool when the workspace has none"""
+    with patch("prefect_cloud.auth.get_prefect_cloud_client") as mock_client:
+        client = AsyncMock()
+        mock_client.return_value.__aenter__.return_value = client
+
+        client.get_default_managed_work_pool = AsyncMock(return_value=None)
+        client.get_default_base_job_template_for_managed_work_pool = AsyncMock(
+            return_value={"job_configuration": {}}
+        )
+        client.create_managed_work_pool = AsyncMock(
+            return_value=WorkPool(
+                type="prefect:managed", name="new-pool", is_paused=False
+            )
+        )
+        client.create_managed_deployment = AsyncMock(return_value="test-deployment-id")
+
+        with patch(
+            "prefect_cloud.cli.deployments.auth.get_cloud_urls_or_login"
+        ) as mock_urls:
+            mock_urls.return_value = ("https://ui.url", "https://api.url", "test-key")
+
+            with patch(
+                "prefect_cloud.github.GitHubRepo.get_file_contents"
+            ) as mock_content:
+                mock_content.return_value = textwrap.dedent("""
+                    def test_function():
+                        pass
+                """).lstrip()
+
+                invoke_and_assert(
+                    command=[
+                        "deploy",
+                        "test.py:test_function",
+                        "--from",
+                        "github.com/owner/repo",
+                    ],
+                    expected_code=0,
+                    expected_output_contains="Deployed test_function",
+                )
+
+                client.get_default_managed_work_pool.assert_called_once()
+                client.create_managed_work_pool.assert_called_once_with(
+                    {"job_configuration": {}}
+                )
+                call_kwargs = client.create_managed_deployment.call_args[1]
+                assert call_kwargs["work_pool_name"] == "new-pool"
+
+
 def test_deploy_private_repo_without_credentials():
     """Test deployment fails appropriately when accessing private repo without credentials"""
     with patch("prefect_cloud.auth.get_prefect_cloud_client") as mock_client:
@@ -294,6 +394,9 @@ def test_deploy_private_repo_without_credentials():
                     ],
                 )
 
+                # Nothing is provisioned for a deploy that can't go ahead
+                client.create_managed_work_pool.assert_not_called()
+
 
 def test_deploy_with_env_vars():
     """Test deployment with environment variables"""
@@ -301,7 +404,7 @@ def test_deploy_with_env_vars():
         client = AsyncMock()
         mock_client.return_value.__aenter__.return_value = client
 
-        client.ensure_managed_work_pool = AsyncMock(
+        client.get_default_managed_work_pool = AsyncMock(
             return_value=WorkPool(
                 type="prefect:managed", name="test-pool", is_paused=False
             )
@@ -375,7 +478,7 @@ def test_deploy_with_secrets():
     with patch("prefect_cloud.auth.get_prefect_cloud_client") as mock_client:
         client = AsyncMock()
         mock_client.return_value.__aenter__.return_value = client
-        client.ensure_managed_work_pool = AsyncMock(
+        client.get_default_managed_work_pool = AsyncMock(
             return_value=WorkPool(
                 type="prefect:managed", name="test-pool", is_paused=False
             )
@@ -456,7 +559,7 @@ def test_deploy_with_existing_secret_references():
     with patch("prefect_cloud.auth.get_prefect_cloud_client") as mock_client:
         client = AsyncMock()
         mock_client.return_value.__aenter__.return_value = client
-        client.ensure_managed_work_pool = AsyncMock(
+        client.get_default_managed_work_pool = AsyncMock(
             return_value=WorkPool(
                 type="prefect:managed", name="test-pool", is_paused=False
             )
@@ -535,7 +638,7 @@ def test_deploy_with_parameters():
         client = AsyncMock()
         mock_client.return_value.__aenter__.return_value = client
 
-        client.ensure_managed_work_pool = AsyncMock(
+        client.get_default_managed_work_pool = AsyncMock(
             return_value=WorkPool(
                 type="prefect:managed", name="test-pool", is_paused=False
             )
@@ -641,7 +744,7 @@ def test_deploy_with_private_repo_credentials():
         client = AsyncMock()
         mock_client.return_value.__aenter__.return_value = client
 
-        client.ensure_managed_work_pool = AsyncMock(
+        client.get_default_managed_work_pool = AsyncMock(
             return_value=WorkPool(
                 type="prefect:managed", name="test-pool", is_paused=False
             )
@@ -747,62 +850,74 @@ def test_deploy_function_not_found():
                     expected_output_contains="Could not find function 'test_function'",
                 )
 
+                client.create_managed_work_pool.assert_not_called()
+
 
 def test_run():
     """Test running a deployment"""
-    mock_deployment = DeploymentResponse(
-        id=uuid4(),
-        flow_id=uuid4(),
-        name="test-deployment",
-        work_pool_name="test-pool",
-        schedules=[],
-    )
-    with (
-        patch("prefect_cloud.auth.get_prefect_cloud_client") as mock_client,
-        patch("prefect_cloud.deployments.get_deployment", return_value=mock_deployment),
-    ):
-        client = AsyncMock()
-        mock_client.return_value.__aenter__.return_value = client
+    with patch(
+        "prefect_cloud.cli.deployments.auth.get_cloud_urls_or_login"
+    ) as mock_urls:
+        mock_urls.return_value = ("https://ui.url", "https://api.url", "test-key")
+
+        with patch("prefect_cloud.cli.deployments.deployments.run") as mock_run:
+            # Create a proper mock for the flow run
+            flow_run_mock = MagicMock()
+            flow_run_mock.id = "test-run-id"
+            flow_run_mock.name = "test-run"
+
+            mock_run.return_value = DeploymentRunContext(
+                flow_run=flow_run_mock,
+                work_pool=WorkPool(
+                    type="prefect:managed", name="test-pool", is_paused=False
+                ),
+            )
 
-        client.read_work_pool_by_name = AsyncMock(
-            return_value=WorkPool(
-                type="prefect:managed", name="test-pool", is_paused=False
+            invoke_and_assert(
+                command=[
+                    "run",
+                    "test_deployment",
+                    "--parameter",
+                    "x=1",
+                    "--parameter",
+                    "y=test",
+                ],
+                expected_code=0,
+                expected_output_contains=[
+                    "Started flow run test-run",
+                    "View at: https://ui.url/runs/flow-run/test-run-id",
+                ],
             )
-        )
 
-        with patch(
-            "prefect_cloud.cli.deployments.auth.get_cloud_urls_or_login"
-        ) as mock_urls:
-            mock_urls.return_value = ("https://ui.url", "https://api.url", "test-key")
+            # Verify the deployment was run with parameters
+            mock_run.assert_called_once_with("test_deployment", {"x": 1, "y": "test"})
 
-            with patch("prefect_cloud.cli.deployments.deployments.run") as mock_run:
-                # Create a proper mock for the flow run
-                flow_run_mock = MagicMock()
-                flow_run_mock.id = "test-run-id"
-                flow_run_mock.name = "test-run"
 
-                mock_run.return_value = flow_run_mock
+def test_run_without_work_pool():
+    """Test a run is still reported when its work pool couldn't be read"""
+    with patch(
+        "prefect_cloud.cli.deployments.auth.get_cloud_urls_or_login"
+    ) as mock_urls:
+        mock_urls.return_value = ("https://ui.url", "https://api.url", "test-key")
 
-                invoke_and_assert(
-                    command=[
-                        "run",
-                        "test_deployment",
-                        "--parameter",
-                        "x=1",
-                        "--parameter",
-                        "y=test",
-                    ],
-                    expected_code=0,
-                    expected_output_contains=[
-                        "Started flow run test-run",
-                        "View at: https://ui.url/runs/flow-run/test-run-id",
-                    ],
-                )
+        with patch("prefect_cloud.cli.deployments.deployments.run") as mock_run:
+            flow_run_mock = MagicMock()
+            flow_run_mock.id = "test-run-id"
+            flow_run_mock.name = "test-run"
 
-                # Verify the deployment was run with parameters
-                mock_run.assert_called_once_with(
-                    "test_deployment", {"x": 1, "y": "test"}
-                )
+            mock_run.return_value = DeploymentRunContext(
+                flow_run=flow_run_mock, work_pool=None
+            )
+
+            invoke_and_assert(
+                command=["run", "test_deployment"],
+                expected_code=0,
+                expected_output_contains=[
+                    "Started flow run test-run",
+                    "View at: https://ui.url/runs/flow-run/test-run-id",
+                ],
+                expected_output_does_not_contain="paused",
+            )
 
 
 def test_deploy_with_dependencies():
@@ -811,7 +926,7 @@ def test_deploy_with_dependencies():
         client = AsyncMock()
         mock_client.return_value.__aenter__.return_value = client
 
-        client.ensure_managed_work_pool = AsyncMock(
+        client.get_default_managed_work_pool = AsyncMock(
             return_value=WorkPool(
                 type="prefect:managed", name="test-pool", is_paused=False
             )
@@ -894,7 +1009,7 @@ def test_deploy_with_requirements_file():
         client = AsyncMock()
         mock_client.return_value.__aenter__.return_value = client
 
-        client.ensure_managed_work_pool = AsyncMock(
+        client.get_default_managed_work_pool = AsyncMock(
             return_value=WorkPool(
                 type="prefect:managed", name="test-pool", is_paused=False
             )
@@ -970,7 +1085,7 @@ def test_deploy_with_github_app():
         client = AsyncMock()
         mock_client.return_value.__aenter__.return_value = client
 
-        client.ensure_managed_work_pool = AsyncMock(
+        client.get_default_managed_work_pool = AsyncMock(
             return_value=WorkPool(
                 type="prefect:managed", name="test-pool", is_paused=False
             )
@@ -1061,7 +1176,7 @@ def test_deploy_with_quiet_flag():
         client = AsyncMock()
         mock_client.return_value.__aenter__.return_value = client
 
-        client.ensure_managed_work_pool = AsyncMock(
+        client.get_default_managed_work_pool = AsyncMock(
             return_value=WorkPool(
                 type="prefect:managed", name="test-pool", is_paused=False
             )
@@ -1118,7 +1233,7 @@ def test_deploy_programmatic_invocation():
         mock_client.return_value.__aenter__.return_value = client
 
         deployment_id = uuid4()
-        client.ensure_managed_work_pool = AsyncMock(
+        client.get_default_managed_work_pool = AsyncMock(
             return_value=WorkPool(
                 type="prefect:managed", name="test-pool", is_paused=False
             )
@@ -1170,7 +1285,7 @@ def test_deploy_with_custom_deployment_name():
         client = AsyncMock()
         mock_client.return_value.__aenter__.return_value = client
 
-        client.ensure_managed_work_pool = AsyncMock(
+        client.get_default_managed_work_pool = AsyncMock(
             return_value=WorkPool(
                 type="prefect:managed", name="test-pool", is_paused=False
             )
@@ -1226,7 +1341,7 @@ def test_deploy_programmatic_with_custom_names():
         mock_client.return_value.__aenter__.return_value = client
 
         deployment_id = uuid4()
-        client.ensure_managed_work_pool = AsyncMock(
+        client.get_default_managed_work_pool = AsyncMock(
             return_value=WorkPool(
                 type="prefect:managed", name="test-pool", is_paused=False
             )
@@ -1277,7 +1392,7 @@ def test_deploy_with_python_version():
         client = AsyncMock()
         mock_client.return_value.__aenter__.return_value = client
 
-        client.ensure_managed_work_pool = AsyncMock(
+        client.get_default_managed_work_pool = AsyncMock(
             return_value=WorkPool(
                 type="prefect:managed", name="test-pool", is_paused=False
             )
@@ -1350,3 +1465,106 @@ def test_deploy_with_python_version():
                     "job_variables"
                 ]
                 assert job_variables["image"] == "prefecthq/prefect-client:3-python3.12"
+
+
+def test_ls():
+    """`prefect-cloud ls` should list each deployment with its schedules"""
+    flow = Flow(id=uuid4(), name="my-flow")
+    active = Deployment(
+        id=uuid4(),
+        flow_id=flow.id,
+        name="active",
+        schedules=[
+            DeploymentSchedule(
+                id=uuid4(),
+                schedule=CronSchedule(cron="0 12 * * *", timezone="UTC"),
+                active=True,
+            )
+        ],
+    )
+    paused = Deployment(
+        id=uuid4(),
+        flow_id=flow.id,
+        name="paused",
+        schedules=[
+            DeploymentSchedule(
+                id=uuid4(),
+                schedule=IntervalSchedule(interval=timedelta(seconds=60)),
+                active=False,
+            )
+        ],
+    )
+    context = DeploymentListContext(
+        deployments=[active, paused],
+        flows_by_id={flow.id: flow},
+        next_runs_by_deployment_id={},
+    )
+
+    with patch("prefect_cloud.cli.deployments.deployments.list", return_value=context):
+        with temporary_console_width(app.console, 200):
+            invoke_and_assert(
+                command=["ls"],
+                expected_code=0,
+                expected_output_contains=[
+                    "my-flow/active",
+                    "✓ 0 12 * * * (UTC)",
+                    str(active.id),
+                    "my-flow/paused",
+                    "Every 0:01:00 seconds",
+                    str(paused.id),
+                ],
+            )
+
+
+def test_schedule_passes_parameters():
+    """`prefect-cloud schedule` should pass parsed parameters to the new schedule"""
+    with patch("prefect_cloud.cli.deployments.deployments.schedule") as mock_schedule:
+        invoke_and_assert(
+            command=["schedule", "flow/deployment", "0 12 * * *", "-p", "x=1"],
+            expected_code=0,
+            expected_output_contains="Deployment scheduled",
+        )
+
+    mock_schedule.assert_called_once_with("flow/deployment", "0 12 * * *", {"x": 1})
+
+
+def test_schedule_none_ignores_parameters():
+    """`prefect-cloud schedule ... none` should not parse parameters it won't use"""
+    with patch("prefect_cloud.cli.deployments.deployments.schedule") as mock_schedule:
+        invoke_and_assert(
+            command=["schedule", "flow/deployment", "none", "-p", "not-a-pair"],
+            expected_code=0,
+            expected_output_contains="Deployment scheduled",
+        )
+
+    mock_schedule.assert_called_once_with("flow/deployment", "none", None)
+
+
+def test_delete_clears_completion_cache(mock_completion_cache: Path):
+    """`prefect-cloud delete` should clear the cached deployment names"""
+    mock_completion_cache.write_text('{"deployment_names": ["flow/deployment"]}')
+
+    with patch("prefect_cloud.cli.deployments.deployments.delete") as mock_delete:
+        invoke_and_assert(
+            command=["delete", "flow/deployment"],
+            expected_code=0,
+            expected_output_contains="Deployment deleted",
+        )
+
+    mock_delete.assert_called_once_with("flow/deployment")
+    assert not mock_completion_cache.exists()
+
+
+def test_deploy_invalid_function():
+    """`prefect-cloud deploy` should reject a function without a file path"""
+    with patch(
+        "prefect_cloud.cli.deployments.auth.get_cloud_urls_or_login"
+    ) as mock_urls:
+        mock_urls.return_value = ("https://ui.url", "https://api.url", "test-key")
+
+        for function in ["test_function", "test.py:", ":test_function"]:
+            invoke_and_assert(
+                command=["deploy", function, "--from", "github.com/owner/repo"],
+                expected_code=1,
+                expected_output_contains="Invalid function",
+            )
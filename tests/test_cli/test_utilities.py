@@ -1,5 +1,14 @@
+import asyncio
+from unittest.mock import patch
+
 import pytest
-from prefect_cloud.cli.utilities import process_key_value_pairs
+from typer.testing import CliRunner
+
+from prefect_cloud.cli.utilities import (
+    PrefectCloudTyper,
+    process_key_value_pairs,
+    run_sync,
+)
 
 
 def test_process_key_value_pairs():
@@ -110,3 +119,77 @@ def test_process_key_value_pairs_strips_whitespace_and_quotes():
         "str": "string",  # JSON parser handles internal quotes
     }
     assert process_key_value_pairs(input_pairs_json, as_json=True) == expected_json
+
+
+def test_process_key_value_pairs_json_skips_parsing_plain_strings():
+    """`process_key_value_pairs` should not invoke the JSON parser for values
+    that cannot be JSON"""
+    with patch("prefect_cloud.cli.utilities.json.loads") as mock_loads:
+        mock_loads.return_value = 42
+        result = process_key_value_pairs(
+            ["name=hello", "path=/tmp/x", "count=42"], as_json=True
+        )
+
+    assert result == {"name": "hello", "path": "/tmp/x", "count": 42}
+    mock_loads.assert_called_once_with("42")
+
+
+def test_quiet_does_not_leak_between_commands():
+    """`quiet` set by one command should not silence the next command"""
+    app = PrefectCloudTyper()
+
+    @app.command()
+    def loud():
+        app.exit_with_success("loud")
+
+    @app.command()
+    def hushed():
+        app.quiet = True
+        app.exit_with_success("hushed")
+
+    runner = CliRunner()
+    assert runner.invoke(app, ["hushed"]).output == ""
+    assert "loud" in runner.invoke(app, ["loud"]).output
+    assert not app.quiet
+
+
+def test_quiet_suppresses_unexpected_errors():
+    """An unexpected error from a `--quiet` async command should not be printed"""
+    app = PrefectCloudTyper()
+
+    @app.command()
+    async def failing(quiet: bool = False):
+        app.quiet = quiet
+        raise ValueError("kaboom")
+
+    # A second command keeps `failing` a subcommand rather than the whole app
+    @app.command()
+    def other():
+        pass
+
+    runner = CliRunner()
+    result = runner.invoke(app, ["failing", "--quiet"])
+    assert result.exit_code == 1
+    assert "kaboom" not in result.stdout
+
+    result = runner.invoke(app, ["failing"])
+    assert result.exit_code == 1
+    assert "kaboom" in result.stdout
+
+
+def test_run_sync_reuses_event_loop():
+    """`run_sync` should run each coroutine on the same event loop"""
+
+    async def current_loop() -> asyncio.AbstractEventLoop:
+        return asyncio.get_running_loop()
+
+    assert run_sync(current_loop()) is run_sync(current_loop())
+
+
+async def test_run_sync_inside_running_loop():
+    """`run_sync` should fall back to a separate thread when a loop is running"""
+
+    async def current_loop() -> asyncio.AbstractEventLoop:
+        return asyncio.get_running_loop()
+
+    assert run_sync(current_loop()) is not asyncio.get_running_loop()
@@ -220,6 +220,64 @@ async def test_upsert_block_document_creates_block(
     assert result == mock_block_document
 
 
+async def test_create_or_replace_secret_reads_block_type_once(
+    client: PrefectCloudClient,
+    mock_block_type: BlockType,
+    mock_block_schema: BlockSchema,
+    mock_block_document: BlockDocument,
+    respx_mock: respx.Router,
+):
+    read_block_type = respx_mock.get(f"{PREFECT_API_URL}/block_types/slug/secret").mock(
+        return_value=Response(200, json=mock_block_type.model_dump(mode="json"))
+    )
+    read_block_schema = respx_mock.post(f"{PREFECT_API_URL}/block_schemas/filter").mock(
+        return_value=Response(200, json=[mock_block_schema.model_dump(mode="json")])
+    )
+    upsert = respx_mock.put(f"{PREFECT_API_URL}/block_documents/").mock(
+        return_value=Response(200, json=mock_block_document.model_dump(mode="json"))
+    )
+
+    await client.create_or_replace_secret(name="first", secret="one")
+    await client.create_or_replace_secret(name="second", secret="two")
+
+    assert read_block_type.call_count == 1
+    assert read_block_schema.call_count == 1
+    assert upsert.call_count == 2
+
+
+async def test_get_most_recent_block_schema_for_block_type(
+    client: PrefectCloudClient,
+    mock_block_type: BlockType,
+    mock_block_schema: BlockSchema,
+    respx_mock: respx.Router,
+):
+    respx_mock.post(f"{PREFECT_API_URL}/block_schemas/filter").mock(
+        return_value=Response(200, json=[mock_block_schema.model_dump(mode="json")])
+    )
+
+    result = await client.get_most_recent_block_schema_for_block_type(
+        block_type_id=mock_block_type.id
+    )
+
+    assert result == mock_block_schema
+
+
+async def test_get_most_recent_block_schema_for_block_type_none_found(
+    client: PrefectCloudClient,
+    mock_block_type: BlockType,
+    respx_mock: respx.Router,
+):
+    respx_mock.post(f"{PREFECT_API_URL}/block_schemas/filter").mock(
+        return_value=Response(200, json=[])
+    )
+
+    result = await client.get_most_recent_block_schema_for_block_type(
+        block_type_id=mock_block_type.id
+    )
+
+    assert result is None
+
+
 async def test_read_deployment_by_name(
     client: PrefectCloudClient,
     mock_deployment: DeploymentResponse,
@@ -1,3 +1,4 @@
+from unittest.mock import AsyncMock
 from uuid import UUID, uuid4
 
 import pytest
@@ -5,7 +6,7 @@ import respx
 from httpx import Response
 
 from prefect_cloud import deployments
-from prefect_cloud.schemas.objects import DeploymentFlowRun
+from prefect_cloud.schemas.objects import DeploymentFlowRun, WorkPool
 from prefect_cloud.schemas.responses import DeploymentResponse
 from prefect_cloud.utilities.exception import ObjectNotFound
 
@@ -50,6 +51,15 @@ def mock_deployment() -> DeploymentResponse:
     )
 
 
+@pytest.fixture
+def mock_work_pool(cloud_api: respx.Router, api_url: str) -> WorkPool:
+    work_pool = WorkPool(name="test-pool", type="prefect:managed", is_paused=True)
+    cloud_api.get(f"{api_url}/work_pools/{work_pool.name}").mock(
+        return_value=Response(200, json=work_pool.model_dump(mode="json"))
+    )
+    return work_pool
+
+
 @pytest.fixture
 def mock_flow_run() -> DeploymentFlowRun:
     return DeploymentFlowRun(
@@ -63,6 +73,7 @@ async def test_run_deployment_by_id(
     cloud_api: respx.Router,
     mock_deployment: DeploymentResponse,
     mock_flow_run: DeploymentFlowRun,
+    mock_work_pool: WorkPool,
     api_url: str,
 ):
     """run() should create a flow run when given a deployment ID"""
@@ -80,14 +91,16 @@ async def test_run_deployment_by_id(
 
     result = await deployments.run(str(mock_deployment.id))
 
-    assert result.id == mock_flow_run.id
-    assert result.deployment_id == mock_deployment.id
+    assert result.flow_run.id == mock_flow_run.id
+    assert result.flow_run.deployment_id == mock_deployment.id
+    assert result.work_pool == mock_work_pool
 
 
 async def test_run_deployment_by_name(
     cloud_api: respx.Router,
     mock_deployment: DeploymentResponse,
     mock_flow_run: DeploymentFlowRun,
+    mock_work_pool: WorkPool,
     api_url: str,
 ):
     """run() should create a flow run when given a deployment name"""
@@ -106,8 +119,9 @@ async def test_run_deployment_by_name(
 
     result = await deployments.run(deployment_name)
 
-    assert result.id == mock_flow_run.id
-    assert result.deployment_id == mock_deployment.id
+    assert result.flow_run.id == mock_flow_run.id
+    assert result.flow_run.deployment_id == mock_deployment.id
+    assert result.work_pool == mock_work_pool
 
 
 async def test_run_deployment_not_found(
@@ -122,3 +136,78 @@ async def test_run_deployment_not_found(
 
     with pytest.raises(ObjectNotFound):
         await deployments.run(str(deployment_id))
+
+
+async def test_run_uses_a_single_client(
+    cloud_api: respx.Router,
+    mock_deployment: DeploymentResponse,
+    mock_flow_run: DeploymentFlowRun,
+    mock_work_pool: WorkPool,
+    api_url: str,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """run() should read the deployment, create the run, and read the work pool
+    with one client"""
+    cloud_api.get(f"{api_url}/deployments/{mock_deployment.id}").mock(
+        return_value=Response(200, json=mock_deployment.model_dump(mode="json"))
+    )
+    cloud_api.post(f"{api_url}/deployments/{mock_deployment.id}/create_flow_run").mock(
+        return_value=Response(201, json=mock_flow_run.model_dump(mode="json"))
+    )
+    get_client = AsyncMock(wraps=deployments.get_prefect_cloud_client)
+    monkeypatch.setattr(deployments, "get_prefect_cloud_client", get_client)
+
+    await deployments.run(str(mock_deployment.id))
+
+    assert get_client.await_count == 1
+    assert len(cloud_api.calls) == 3
+
+
+async def test_run_deployment_without_work_pool(
+    cloud_api: respx.Router,
+    mock_deployment: DeploymentResponse,
+    mock_flow_run: DeploymentFlowRun,
+    api_url: str,
+):
+    """run() should still return the flow run when the work pool can't be read"""
+    cloud_api.get(f"{api_url}/deployments/{mock_deployment.id}").mock(
+        return_value=Response(200, json=mock_deployment.model_dump(mode="json"))
+    )
+    cloud_api.post(f"{api_url}/deployments/{mock_deployment.id}/create_flow_run").mock(
+        return_value=Response(201, json=mock_flow_run.model_dump(mode="json"))
+    )
+    cloud_api.get(f"{api_url}/work_pools/{mock_deployment.work_pool_name}").mock(
+        return_value=Response(404, json={"detail": "Work pool not found"})
+    )
+
+    result = await deployments.run(str(mock_deployment.id))
+
+    assert result.flow_run.id == mock_flow_run.id
+    assert result.work_pool is None
+
+
+async def test_get_deployment_by_id(
+    cloud_api: respx.Router, mock_deployment: DeploymentResponse, api_url: str
+):
+    """get_deployment() should read a deployment by ID"""
+    cloud_api.get(f"{api_url}/deployments/{mock_deployment.id}").mock(
+        return_value=Response(200, json=mock_deployment.model_dump(mode="json"))
+    )
+
+    result = await deployments.get_deployment(str(mock_deployment.id))
+
+    assert result.id == mock_deployment.id
+
+
+async def test_get_deployment_by_name(
+    cloud_api: respx.Router, mock_deployment: DeploymentResponse, api_url: str
+):
+    """get_deployment() should read a deployment by name"""
+    deployment_name = "my-flow/my-deployment"
+    cloud_api.get(f"{api_url}/deployments/name/{deployment_name}").mock(
+        return_value=Response(200, json=mock_deployment.model_dump(mode="json"))
+    )
+
+    result = await deployments.get_deployment(deployment_name)
+
+    assert result.id == mock_deployment.id
@@ -162,6 +162,70 @@ async def test_schedule_removes_prior_schedules(
     assert delete_schedule.called
 
 
+async def test_schedule_removes_all_prior_schedules(
+    cloud_api: respx.Router,
+    mock_deployment: DeploymentResponse,
+    api_url: str,
+):
+    mock_deployment.schedules = [
+        DeploymentSchedule(
+            deployment_id=mock_deployment.id,
+            id=uuid4(),
+            schedule=CronSchedule(cron=f"0 {hour} * * *", timezone="UTC"),
+            active=True,
+        )
+        for hour in range(3)
+    ]
+    cloud_api.get(f"{api_url}/deployments/{mock_deployment.id}").mock(
+        return_value=Response(200, json=mock_deployment.model_dump(mode="json"))
+    )
+    delete_schedules = [
+        cloud_api.delete(
+            f"{api_url}/deployments/{mock_deployment.id}/schedules/{prior.id}"
+        ).mock(return_value=Response(204))
+        for prior in mock_deployment.schedules
+    ]
+
+    await deployments.schedule(str(mock_deployment.id), "none")
+
+    assert all(delete_schedule.called for delete_schedule in delete_schedules)
+    assert len(cloud_api.calls) == 4  # One get and three deletes, no create
+
+
+async def test_schedule_finishes_prior_deletes_before_raising(
+    cloud_api: respx.Router,
+    mock_deployment: DeploymentResponse,
+    api_url: str,
+):
+    mock_deployment.schedules = [
+        DeploymentSchedule(
+            deployment_id=mock_deployment.id,
+            id=uuid4(),
+            schedule=CronSchedule(cron=f"0 {hour} * * *", timezone="UTC"),
+            active=True,
+        )
+        for hour in range(3)
+    ]
+    cloud_api.get(f"{api_url}/deployments/{mock_deployment.id}").mock(
+        return_value=Response(200, json=mock_deployment.model_dump(mode="json"))
+    )
+    delete_schedules = [
+        cloud_api.delete(
+            f"{api_url}/deployments/{mock_deployment.id}/schedules/{prior.id}"
+        ).mock(return_value=Response(404 if index == 0 else 204))
+        for index, prior in enumerate(mock_deployment.schedules)
+    ]
+    create_schedule = cloud_api.post(
+        f"{api_url}/deployments/{mock_deployment.id}/schedules"
+    ).mock(return_value=Response(201, json=[]))
+
+    with pytest.raises(ObjectNotFound):
+        await deployments.schedule(str(mock_deployment.id), "0 12 * * *")
+
+    assert all(delete_schedule.called for delete_schedule in delete_schedules)
+    assert not create_schedule.called
+
+
 async def test_schedule_accepts_deployment_name(
     cloud_api: respx.Router, mock_deployment: DeploymentResponse, api_url: str
 ):
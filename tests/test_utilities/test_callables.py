@@ -1,3 +1,4 @@
+import ast
 import datetime
 from enum import Enum
 from pathlib import Path
@@ -9,6 +10,7 @@ import pytest
 from pydantic import SecretStr
 
 from prefect_cloud.utilities.callables import (
+    get_parameter_schema_from_content,
     parameter_schema,
     parameter_schema_from_entrypoint,
 )
@@ -1502,3 +1504,44 @@ class TestEntrypointToSchema:
             "type": "object",
             "definitions": {},
         }
+
+
+class TestContentToSchema:
+    source_code = dedent(
+        """
+    def f(x: int = 42):
+        \"\"\"
+        Args:
+            x: the answer
+        \"\"\"
+
+    if __name__ == "__main__":
+        f()
+    """
+    )
+    expected = {
+        "properties": {
+            "x": {
+                "title": "x",
+                "position": 0,
+                "type": "integer",
+                "default": 42,
+                "description": "the answer",
+            }
+        },
+        "title": "Parameters",
+        "type": "object",
+        "definitions": {},
+    }
+
+    def test_function_from_source_string(self):
+        schema = get_parameter_schema_from_content(self.source_code, "f")
+        assert schema.model_dump_for_openapi() == self.expected
+
+    def test_function_from_parsed_module(self):
+        module = ast.parse(self.source_code)
+
+        schema = get_parameter_schema_from_content(module, "f")
+
+        assert schema.model_dump_for_openapi() == self.expected
+        assert len(module.body) == 2, "the parsed module should not be modified"